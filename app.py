@@ -2,6 +2,12 @@
 import os
 import sqlite3
 import datetime
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import wraps
+from urllib.parse import urlencode
 from flask import Flask, request, jsonify, g
 from flask_cors import CORS
 
@@ -28,6 +34,306 @@ def close_connection(exception):
 def row_to_dict(row):
     return {k: row[k] for k in row.keys()}
 
+# Tables tracked in sync_log, mapped to their primary key
+SYNC_TABLES = {
+    'categories': 'category_id',
+    'products': 'product_id',
+    'customers': 'customer_id',
+    'orders': 'order_id',
+    'payments': 'payment_id',
+}
+
+# --------------------------
+# Response cache for read endpoints
+# --------------------------
+class MemoryCache:
+    """Per-process LRU cache with TTL."""
+    name = 'memory'
+
+    def __init__(self, max_entries=256, ttl=300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entries = OrderedDict()  # key -> (expires, tables, value)
+        self.table_generations = {}   # table -> number of invalidations so far
+        self.counters = {'hits': 0, 'misses': 0}
+        self.lock = threading.Lock()
+
+    def record(self, stat):
+        with self.lock:
+            self.counters[stat] += 1
+
+    def totals(self):
+        with self.lock:
+            return dict(self.counters)
+
+    def generations(self, tables):
+        with self.lock:
+            return tuple(self.table_generations.get(t, 0) for t in tables)
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[2]
+
+    def set(self, key, value, tables, generations):
+        with self.lock:
+            # a write invalidated these tables while the response was being built
+            if tuple(self.table_generations.get(t, 0) for t in tables) != generations:
+                return
+            self.entries[key] = (time.time() + self.ttl, set(tables), value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, tables):
+        with self.lock:
+            for t in tables:
+                self.table_generations[t] = self.table_generations.get(t, 0) + 1
+            for key in [k for k, e in self.entries.items() if e[1] & set(tables)]:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.counters = {'hits': 0, 'misses': 0}
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SqliteCache:
+    """
+    LRU cache with TTL stored in a SQLite file, shared by all worker processes using the same path.
+    Hits only write when last_used is older than touch_interval, so reads stay concurrent.
+    Hit/miss counts are shared too, buffered per process and flushed every
+    stats_flush_every events or stats_flush_interval seconds.
+    Any sqlite3.Error is logged and treated as a miss / no-op so requests fall through to the view.
+    """
+    name = 'sqlite'
+
+    def __init__(self, path='cache.db', max_entries=256, ttl=300):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.touch_interval = min(30, ttl / 4)
+        self.stats_flush_every = 50
+        self.stats_flush_interval = 5
+        self.pending = {'hits': 0, 'misses': 0}
+        self.pending_since = time.time()
+        self.pending_lock = threading.Lock()
+        self.local = threading.local()
+        conn = self.connect()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS response_cache (
+            cache_key TEXT PRIMARY KEY,
+            tables TEXT,
+            value BLOB,
+            expires REAL,
+            last_used REAL
+        );
+        ''')
+        conn.execute('CREATE INDEX IF NOT EXISTS idx_response_cache_last_used ON response_cache (last_used)')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS cache_generations (
+            table_name TEXT PRIMARY KEY,
+            generation INTEGER
+        );
+        ''')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS cache_counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER
+        );
+        ''')
+
+    def connect(self):
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            # autocommit; multi-statement writes use explicit BEGIN IMMEDIATE
+            conn = self.local.conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        return conn
+
+    def failed(self, conn, action, e):
+        if conn.in_transaction:
+            conn.rollback()
+        app.logger.warning('response cache %s failed: %s', action, e)
+
+    def current_generations(self, conn, tables):
+        rows = dict(conn.execute('SELECT table_name, generation FROM cache_generations WHERE table_name IN (%s)'
+                                 % ','.join('?' * len(tables)), tables).fetchall())
+        return tuple(rows.get(t, 0) for t in tables)
+
+    def generations(self, tables):
+        conn = self.connect()
+        try:
+            return self.current_generations(conn, tables)
+        except sqlite3.Error as e:
+            self.failed(conn, 'generations', e)
+            return None
+
+    def get(self, key):
+        conn = self.connect()
+        now = time.time()
+        try:
+            row = conn.execute('SELECT value, expires, last_used FROM response_cache WHERE cache_key=?', (key,)).fetchone()
+            if row is None or row[1] < now:
+                return None  # expired rows are removed by set()
+            if now - row[2] > self.touch_interval:
+                conn.execute('UPDATE response_cache SET last_used=? WHERE cache_key=?', (now, key))
+            return row[0]
+        except sqlite3.Error as e:
+            self.failed(conn, 'get', e)
+            return None
+
+    def set(self, key, value, tables, generations):
+        conn = self.connect()
+        now = time.time()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            # a write invalidated these tables while the response was being built
+            if self.current_generations(conn, tables) != generations:
+                conn.rollback()
+                return
+            # tables stored as ",a,b," so invalidate can match whole names with LIKE
+            conn.execute('INSERT OR REPLACE INTO response_cache (cache_key, tables, value, expires, last_used) VALUES (?, ?, ?, ?, ?)',
+                         (key, ',' + ','.join(tables) + ',', value, now + self.ttl, now))
+            conn.execute('DELETE FROM response_cache WHERE expires < ?', (now,))
+            conn.execute('DELETE FROM response_cache WHERE cache_key IN (SELECT cache_key FROM response_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                         (self.max_entries,))
+            conn.commit()
+        except sqlite3.Error as e:
+            self.failed(conn, 'set', e)
+
+    def invalidate(self, tables):
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            for table in tables:
+                conn.execute('INSERT INTO cache_generations (table_name, generation) VALUES (?, 1) '
+                             'ON CONFLICT(table_name) DO UPDATE SET generation = generation + 1', (table,))
+                conn.execute('DELETE FROM response_cache WHERE tables LIKE ?', ('%,' + table + ',%',))
+            conn.commit()
+        except sqlite3.Error as e:
+            self.failed(conn, 'invalidate', e)
+
+    def record(self, stat):
+        with self.pending_lock:
+            self.pending[stat] += 1
+            due = (sum(self.pending.values()) >= self.stats_flush_every or
+                   time.time() - self.pending_since >= self.stats_flush_interval)
+        if due:
+            self.flush_counters()
+
+    def flush_counters(self):
+        with self.pending_lock:
+            pending, self.pending = self.pending, {'hits': 0, 'misses': 0}
+            self.pending_since = time.time()
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            for name, n in pending.items():
+                if n:
+                    conn.execute('INSERT INTO cache_counters (name, value) VALUES (?, ?) '
+                                 'ON CONFLICT(name) DO UPDATE SET value = value + excluded.value', (name, n))
+            conn.commit()
+        except sqlite3.Error as e:
+            self.failed(conn, 'flush_counters', e)
+            with self.pending_lock:
+                for name, n in pending.items():
+                    self.pending[name] += n
+
+    def totals(self):
+        """Counts from all workers; other workers' last few seconds may still be buffered."""
+        self.flush_counters()
+        try:
+            rows = dict(self.connect().execute('SELECT name, value FROM cache_counters').fetchall())
+        except sqlite3.Error:
+            rows = {}
+        return {'hits': rows.get('hits', 0), 'misses': rows.get('misses', 0)}
+
+    def clear(self):
+        conn = self.connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute('DELETE FROM response_cache')
+            conn.execute('DELETE FROM cache_counters')
+            conn.commit()
+        except sqlite3.Error as e:
+            self.failed(conn, 'clear', e)
+
+    def __len__(self):
+        try:
+            return self.connect().execute('SELECT COUNT(1) FROM response_cache').fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+
+def make_cache():
+    backend = os.environ.get('CACHE_BACKEND', 'memory')
+    max_entries = int(os.environ.get('CACHE_MAX_ENTRIES', 256))
+    ttl = float(os.environ.get('CACHE_TTL', 300))
+    if backend == 'none':
+        return None
+    if backend == 'sqlite':
+        return SqliteCache(os.environ.get('CACHE_PATH', 'cache.db'), max_entries, ttl)
+    if backend == 'memory':
+        return MemoryCache(max_entries, ttl)
+    raise ValueError(f"Unknown CACHE_BACKEND {backend!r}; expected 'memory', 'sqlite' or 'none'")
+
+response_cache = make_cache()
+# This worker's own counts; the backend's totals() covers every worker sharing the cache
+cache_stats = {'process_hits': 0, 'process_misses': 0}
+cache_stats_lock = threading.Lock()
+
+def count_cache(stat):
+    with cache_stats_lock:
+        cache_stats['process_' + stat] += 1
+    response_cache.record(stat)
+
+def cached(*tables):
+    """Cache a GET handler's response, keyed on path + query args; dropped when any of `tables` is written."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if response_cache is None:
+                return view(*args, **kwargs)
+            key = request.path + '?' + urlencode(sorted(request.args.items(multi=True)))
+            body = response_cache.get(key)
+            if body is not None:
+                count_cache('hits')
+                resp = app.response_class(body, mimetype='application/json')
+                resp.headers['X-Cache'] = 'HIT'
+                return resp
+            count_cache('misses')
+            # taken before the view reads the DB, so set() can tell if a write landed in between
+            generations = response_cache.generations(tables)
+            resp = app.make_response(view(*args, **kwargs))
+            if resp.status_code == 200 and generations is not None:
+                response_cache.set(key, resp.get_data(), tables, generations)
+            resp.headers['X-Cache'] = 'MISS'
+            return resp
+        return wrapper
+    return decorator
+
+def invalidates(*tables):
+    """Drop cached responses that depend on `tables` once a write handler succeeds."""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            resp = app.make_response(view(*args, **kwargs))
+            if response_cache is not None and resp.status_code < 400:
+                response_cache.invalidate(tables)
+            return resp
+        return wrapper
+    return decorator
+
 # --------------------------
 # Database creation + seeding
 # --------------------------
@@ -102,6 +408,45 @@ def create_and_seed_db():
         FOREIGN KEY (order_id) REFERENCES orders(order_id)
     );
     ''')
+
+    # Change log used by /api/sync: every write bumps the sequence via triggers,
+    # so stock updates inside create_order etc. are tracked without extra code.
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS sync_log (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        table_name TEXT,
+        row_id INT,
+        op TEXT CHECK(op IN ('insert', 'update', 'delete')),
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_sync_log_row ON sync_log (table_name, row_id)')
+    # epoch identifies this copy of the DB, so clients holding a seq from an earlier run resync;
+    # min_seq / compacted_seq are maintained by compact_sync_log
+    cursor.execute('''
+    CREATE TABLE IF NOT EXISTS sync_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    ''')
+    cursor.execute("INSERT OR IGNORE INTO sync_meta (key, value) VALUES ('epoch', ?), ('min_seq', '0'), ('compacted_seq', '0')",
+                   (uuid.uuid4().hex,))
+    for table, pk in SYNC_TABLES.items():
+        for event, ref in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+            cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {table}_sync_{event.lower()} AFTER {event} ON {table}
+            BEGIN
+                INSERT INTO sync_log (table_name, row_id, op) VALUES ('{table}', {ref}.{pk}, '{event.lower()}');
+            END;
+            ''')
+    # Order items are embedded in orders, so any item change marks the parent order as updated
+    for event, ref in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+        cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS orderitems_sync_{event.lower()} AFTER {event} ON orderitems
+        BEGIN
+            INSERT INTO sync_log (table_name, row_id, op) VALUES ('orders', {ref}.order_id, 'update');
+        END;
+        ''')
     conn.commit()
 
     # Seed only when empty
@@ -213,6 +558,9 @@ def create_and_seed_db():
         conn.commit()
 
     conn.close()
+    # The database is rebuilt on every start, so responses cached by a previous run are stale
+    if response_cache is not None:
+        response_cache.clear()
     print("Database created/seeded (if empty).")
 
 # -------------------
@@ -227,6 +575,7 @@ def serve_index():
 
 # --- Categories ---
 @app.route('/api/categories', methods=['GET'])
+@cached('categories', 'products')
 def list_categories():
     db = get_db()
     cur = db.execute('SELECT * FROM categories ORDER BY category_name ASC')
@@ -240,6 +589,7 @@ def list_categories():
     return jsonify(categories)
 
 @app.route('/api/categories', methods=['POST'])
+@invalidates('categories')
 def create_category():
     data = request.json or {}
     db = get_db()
@@ -252,6 +602,7 @@ def create_category():
     return jsonify({'ok': True, 'category_id': cur.lastrowid}), 201
 
 @app.route('/api/categories/<int:cid>', methods=['PUT'])
+@invalidates('categories')
 def update_category(cid):
     data = request.json or {}
     db = get_db()
@@ -261,6 +612,7 @@ def update_category(cid):
     return jsonify({'ok': True})
 
 @app.route('/api/categories/<int:cid>', methods=['DELETE'])
+@invalidates('categories')
 def delete_category(cid):
     db = get_db()
     db.execute('DELETE FROM categories WHERE category_id=?', (cid,))
@@ -268,6 +620,7 @@ def delete_category(cid):
     return jsonify({'ok': True})
 
 @app.route('/api/categories/<int:cid>/products', methods=['GET'])
+@cached('products')
 def list_products_by_category(cid):
     db = get_db()
     pcur = db.execute('SELECT product_id, product_name, description, price, stock, category_id FROM products WHERE category_id=? ORDER BY product_name ASC', (cid,))
@@ -276,6 +629,7 @@ def list_products_by_category(cid):
 
 # --- Products ---
 @app.route('/api/products', methods=['GET'])
+@cached('products', 'categories')
 def list_products():
     db = get_db()
     cur = db.execute('SELECT p.*, c.category_name FROM products p LEFT JOIN categories c ON p.category_id=c.category_id')
@@ -283,6 +637,7 @@ def list_products():
     return jsonify(rows)
 
 @app.route('/api/products', methods=['POST'])
+@invalidates('products')
 def create_product():
     data = request.json or {}
     db = get_db()
@@ -295,6 +650,7 @@ def create_product():
     return jsonify({'ok': True, 'product_id': cur.lastrowid}), 201
 
 @app.route('/api/products/<int:pid>', methods=['PUT'])
+@invalidates('products')
 def update_product(pid):
     data = request.json or {}
     db = get_db()
@@ -304,6 +660,7 @@ def update_product(pid):
     return jsonify({'ok': True})
 
 @app.route('/api/products/<int:pid>', methods=['DELETE'])
+@invalidates('products')
 def delete_product(pid):
     db = get_db()
     db.execute('DELETE FROM products WHERE product_id=?', (pid,))
@@ -312,6 +669,7 @@ def delete_product(pid):
 
 # --- Customers ---
 @app.route('/api/customers', methods=['GET'])
+@cached('customers')
 def list_customers():
     db = get_db()
     cur = db.execute('SELECT * FROM customers ORDER BY created_at DESC')
@@ -319,6 +677,7 @@ def list_customers():
     return jsonify(rows)
 
 @app.route('/api/customers', methods=['POST'])
+@invalidates('customers')
 def create_customer():
     data = request.json or {}
     db = get_db()
@@ -330,6 +689,7 @@ def create_customer():
 
 # --- Orders ---
 @app.route('/api/orders', methods=['GET'])
+@cached('orders', 'customers', 'products')
 def list_orders():
     db = get_db()
     cur = db.execute('''
@@ -346,6 +706,7 @@ def list_orders():
     return jsonify(orders)
 
 @app.route('/api/orders', methods=['POST'])
+@invalidates('orders', 'products')
 def create_order():
     """
     Expect JSON:
@@ -388,10 +749,12 @@ def create_order():
         db.execute('UPDATE products SET stock = MAX(stock - ?, 0) WHERE product_id=?', (qty, pid))
 
     db.commit()
+    compact_sync_log(db)
     return jsonify({'ok': True, 'order_id': order_id, 'total': round(total, 2)}), 201
 
 # --- Payments ---
 @app.route('/api/payments', methods=['GET'])
+@cached('payments', 'orders')
 def list_payments():
     db = get_db()
     cur = db.execute('SELECT p.*, o.customer_id FROM payments p LEFT JOIN orders o ON p.order_id=o.order_id ORDER BY payment_date DESC')
@@ -399,6 +762,7 @@ def list_payments():
     return jsonify(rows)
 
 @app.route('/api/payments', methods=['POST'])
+@invalidates('payments', 'orders')
 def create_payment():
     data = request.json or {}
     db = get_db()
@@ -424,8 +788,107 @@ def create_payment():
     if data.get('status') == 'Success':
         db.execute('UPDATE orders SET status=? WHERE order_id=?', ('Completed', order_id))
     db.commit()
+    compact_sync_log(db)
     return jsonify({'ok': True, 'payment_id': payment_id}), 201
 
+# --- Sync ---
+# Row shapes match the list endpoints so the frontend can render cached rows directly.
+# {changed} is a subquery yielding the ids to send for that table.
+SYNC_QUERIES = {
+    'categories': 'SELECT * FROM categories WHERE category_id IN {changed}',
+    'products': '''SELECT p.*, c.category_name FROM products p LEFT JOIN categories c ON p.category_id=c.category_id
+                   WHERE p.product_id IN {changed} OR p.category_id IN {changed_categories}''',
+    'customers': 'SELECT * FROM customers WHERE customer_id IN {changed}',
+    'orders': '''SELECT o.*, c.first_name || ' ' || c.last_name AS customer_name
+                 FROM orders o LEFT JOIN customers c ON o.customer_id = c.customer_id
+                 WHERE o.order_id IN {changed} OR o.customer_id IN {changed_customers}''',
+    'payments': '''SELECT p.*, o.customer_id FROM payments p LEFT JOIN orders o ON p.order_id=o.order_id
+                   WHERE p.payment_id IN {changed} OR p.order_id IN {changed_orders}''',
+}
+
+def changed_ids_sql(table):
+    return f"(SELECT row_id FROM sync_log WHERE table_name='{table}' AND seq > :since AND seq <= :seq)"
+
+# Compact the log once this many entries have been written since the last compaction
+SYNC_COMPACT_EVERY = 1000
+
+def compact_sync_log(db):
+    """
+    Bound sync_log to one entry per live row plus recent tombstones.
+    Superseded entries are always safe to drop: the latest seq of a row still answers
+    "changed since X" for any X. Tombstones written before the previous compaction are
+    dropped too, and min_seq is raised so clients older than that get a reset instead.
+    Called by write handlers after they commit; BEGIN IMMEDIATE makes the
+    compacted_seq check-and-update atomic so concurrent writers compact only once.
+    """
+    db.execute('BEGIN IMMEDIATE')
+    seq = db.execute('SELECT COALESCE(MAX(seq), 0) FROM sync_log').fetchone()[0]
+    last = int(db.execute("SELECT value FROM sync_meta WHERE key='compacted_seq'").fetchone()[0])
+    if seq - last < SYNC_COMPACT_EVERY:
+        db.rollback()
+        return
+    db.execute('DELETE FROM sync_log WHERE seq NOT IN (SELECT MAX(seq) FROM sync_log GROUP BY table_name, row_id)')
+    for table, pk in SYNC_TABLES.items():
+        db.execute(f'DELETE FROM sync_log WHERE table_name=? AND seq <= ? AND row_id NOT IN (SELECT {pk} FROM {table})',
+                   (table, last))
+    db.execute("UPDATE sync_meta SET value=? WHERE key='min_seq'", (str(last),))
+    db.execute("UPDATE sync_meta SET value=? WHERE key='compacted_seq'", (str(seq),))
+    db.commit()
+
+@app.route('/api/sync', methods=['GET'])
+def sync():
+    """
+    GET /api/sync?since=<seq>&epoch=<epoch>
+    Returns rows inserted/updated since <seq> plus ids of deleted rows (tombstones):
+    {
+      "seq": <latest seq>,
+      "epoch": "<db epoch>",
+      "reset": false,             # true when the client must drop its cache: epoch differs
+                                  # (DB recreated) or since predates the compacted log
+      "changes": { "<table>": { "upserted": [ ... ], "deleted": [ <id>, ... ] }, ... }
+    }
+    Tables without changes are omitted; since=0 returns a full snapshot.
+    """
+    since = request.args.get('since', 0, type=int)
+    client_epoch = request.args.get('epoch')
+    db = get_db()
+    seq = db.execute('SELECT COALESCE(MAX(seq), 0) FROM sync_log').fetchone()[0]
+    meta = dict(db.execute('SELECT key, value FROM sync_meta').fetchall())
+    reset = since > 0 and (since > seq or since < int(meta['min_seq']) or
+                           (bool(client_epoch) and client_epoch != meta['epoch']))
+    if reset or since < 0:
+        since = 0
+    params = {'since': since, 'seq': seq}
+
+    changes = {}
+    if since < seq:
+        subqueries = {'changed_' + t: changed_ids_sql(t) for t in SYNC_TABLES}
+        for table, pk in SYNC_TABLES.items():
+            sql = SYNC_QUERIES[table].format(changed=changed_ids_sql(table), **subqueries)
+            upserted = [row_to_dict(r) for r in db.execute(sql, params).fetchall()]
+            deleted = [r[0] for r in db.execute(
+                f'SELECT DISTINCT row_id FROM sync_log WHERE table_name=:table AND seq > :since AND seq <= :seq '
+                f'AND row_id NOT IN (SELECT {pk} FROM {table})', dict(params, table=table)).fetchall()]
+            if upserted or deleted:
+                changes[table] = {'upserted': upserted, 'deleted': deleted}
+
+        for order in changes.get('orders', {}).get('upserted', []):
+            items_cur = db.execute('SELECT oi.*, p.product_name FROM orderitems oi LEFT JOIN products p ON oi.product_id=p.product_id WHERE order_id=?', (order['order_id'],))
+            order['items'] = [row_to_dict(i) for i in items_cur.fetchall()]
+
+    return jsonify({'seq': seq, 'epoch': meta['epoch'], 'reset': reset, 'changes': changes})
+
+# --- Cache ---
+@app.route('/api/cache/stats', methods=['GET'])
+def cache_stats_view():
+    with cache_stats_lock:
+        stats = dict(cache_stats)
+    if response_cache is None:
+        return jsonify({'backend': 'none', **stats})
+    return jsonify({'backend': response_cache.name, 'entries': len(response_cache),
+                    'max_entries': response_cache.max_entries, 'ttl': response_cache.ttl,
+                    **response_cache.totals(), **stats})
+
 # ----------------------------
 # Run: ensure DB exists + seed, then start
 # ----------------------------
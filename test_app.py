@@ -0,0 +1,117 @@
+import importlib
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    # app.py removes ./canteen.db on import, so work inside a throwaway directory
+    monkeypatch.chdir(tmp_path)
+    open('canteen.db', 'w').close()
+    monkeypatch.setenv('CACHE_BACKEND', 'memory')
+    app = importlib.reload(sys.modules['app']) if 'app' in sys.modules else importlib.import_module('app')
+    app.create_and_seed_db()
+    return app
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+def sync(client, since=0, epoch=''):
+    return client.get(f'/api/sync?since={since}&epoch={epoch}').get_json()
+
+
+def place_order(client, product_id=1):
+    return client.post('/api/orders', json={'customer_id': 1, 'items': [{'product_id': product_id, 'quantity': 1, 'price': 10}]})
+
+
+def test_sync_returns_only_new_order(client):
+    snapshot = sync(client)
+    resp = place_order(client).get_json()
+    delta = sync(client, snapshot['seq'], snapshot['epoch'])
+    assert not delta['reset']
+    assert [o['order_id'] for o in delta['changes']['orders']['upserted']] == [resp['order_id']]
+    assert [p['product_id'] for p in delta['changes']['products']['upserted']] == [1]
+
+
+def test_sync_reports_tombstones(client):
+    snapshot = sync(client)
+    client.delete('/api/products/2')
+    delta = sync(client, snapshot['seq'], snapshot['epoch'])
+    assert delta['changes']['products'] == {'upserted': [], 'deleted': [2]}
+
+
+def test_sync_resets_on_epoch_change(client):
+    snapshot = sync(client)
+    delta = sync(client, snapshot['seq'], 'stale-epoch')
+    assert delta['reset']
+    assert len(delta['changes']['products']['upserted']) == 10
+
+
+def test_sync_resets_clients_behind_compaction(app_module, client, monkeypatch):
+    monkeypatch.setattr(app_module, 'SYNC_COMPACT_EVERY', 5)
+    old = sync(client)
+    client.delete('/api/products/2')
+    # two compactions: the second drops the tombstone above and raises min_seq past old['seq']
+    for _ in range(2):
+        for _ in range(3):
+            place_order(client)
+
+    db = app_module.sqlite3.connect('canteen.db')
+    meta = dict(db.execute('SELECT key, value FROM sync_meta').fetchall())
+    assert int(meta['min_seq']) > old['seq']
+    rows_per_key = db.execute('SELECT MAX(n) FROM (SELECT COUNT(1) AS n FROM sync_log WHERE seq <= ? GROUP BY table_name, row_id)',
+                              (int(meta['compacted_seq']),)).fetchone()[0]
+    assert rows_per_key == 1
+
+    delta = sync(client, old['seq'], old['epoch'])
+    assert delta['reset']
+    products = delta['changes']['products']
+    assert products['deleted'] == []
+    assert sorted(p['product_id'] for p in products['upserted']) == [1, 3, 4, 5, 6, 7, 8, 9, 10]
+    assert len(delta['changes']['orders']['upserted']) == 11
+
+    # a client that synced after the last compaction still gets a plain delta
+    current = sync(client)
+    place_order(client)
+    delta = sync(client, current['seq'], current['epoch'])
+    assert not delta['reset']
+    assert len(delta['changes']['orders']['upserted']) == 1
+
+
+def test_unknown_cache_backend_is_rejected(app_module, monkeypatch):
+    monkeypatch.setenv('CACHE_BACKEND', 'sqllite')
+    with pytest.raises(ValueError):
+        app_module.make_cache()
+
+
+@pytest.mark.parametrize('backend', ['memory', 'sqlite'])
+def test_cache_drops_fill_that_raced_a_write(app_module, backend):
+    cache = app_module.MemoryCache() if backend == 'memory' else app_module.SqliteCache('cache.db')
+    generations = cache.generations(('products',))
+    cache.invalidate(('products',))
+    cache.set('key', b'old', ('products',), generations)
+    assert cache.get('key') is None
+    cache.set('key', b'new', ('products',), cache.generations(('products',)))
+    assert cache.get('key') == b'new'
+
+
+def test_cache_hit_skips_generation_lookup(app_module, client, monkeypatch):
+    assert client.get('/api/products').headers['X-Cache'] == 'MISS'
+    calls = []
+    original = app_module.response_cache.generations
+    monkeypatch.setattr(app_module.response_cache, 'generations', lambda tables: calls.append(tables) or original(tables))
+    assert client.get('/api/products').headers['X-Cache'] == 'HIT'
+    assert calls == []
+
+
+def test_sqlite_cache_counters_are_shared(app_module):
+    worker_a, worker_b = app_module.SqliteCache('cache.db'), app_module.SqliteCache('cache.db')
+    worker_a.record('hits')
+    worker_a.record('misses')
+    worker_b.record('hits')
+    worker_b.flush_counters()
+    assert worker_a.totals() == {'hits': 2, 'misses': 1}